@@ -13,22 +13,196 @@ Features:
 - Generates detailed audit reports
 
 Usage:
-    python scripts/audit_documentation.py [--fix] [--verbose]
+    python scripts/audit_documentation.py [--fix] [--verbose] [--incremental]
 """
 
 from __future__ import annotations
 
 import argparse
 import ast
+import asyncio
+import hashlib
+import importlib.metadata
 import json
+import os
 import re
-import subprocess
 import sys
-from dataclasses import dataclass, field
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    _json_loads = json.loads
+
+# Patterns are bytes so markdown files never need a full UTF-8 decode; only
+# the matched groups are decoded.
+
+# Python version references like "Python 3.13.2"
+PYTHON_VERSION_PATTERN = re.compile(rb"Python[^\S\n]+(?P<python>\d+\.\d+\.\d+)")
+
+# Package version references like "homeassistant==2026.2.0"
+PACKAGE_VERSION_PATTERN = re.compile(
+    rb"(?P<package>homeassistant|pytest|ruff|mypy)==(?P<pinned>[\d.]+)"
+)
+
+# Fenced Python code blocks
+CODE_BLOCK_PATTERN = re.compile(rb"```python\n(.*?)```", re.DOTALL)
+
+# File/directory references: `file.ext`, [text](path) and bare "dir/" lines.
+# The link branch only consumes "[" so backtick references inside link text
+# are still matched. No branch may cross a newline, since whole files are
+# scanned at once.
+FILE_REFERENCE_PATTERN = re.compile(
+    rb"`(?P<backtick>[a-zA-Z0-9_/.-]+\.(?:py|json|md|yaml|yml|toml|txt))`"
+    rb"|\[(?=(?:[^\[\]\n]|\[[^\]\n]*\])*\]\("
+    rb"(?P<link>[a-zA-Z0-9_/.-]+(?:\.(?:py|json|md|yaml|yml|toml|txt))?)\))"
+    rb"|^(?:[^\S\n]|-)*(?P<dir>[a-zA-Z0-9_/.-]+/)$",
+    re.MULTILINE,
+)
+
+# Every line-level reference kind in one alternation, so each markdown file
+# is scanned once. Each branch is wrapped in a group named after its kind.
+# The kinds never overlap (version references contain spaces or "=", which
+# file references can't), so this finds the same matches as separate scans.
+REFERENCE_KINDS = ("python_version", "package_version", "file_reference")
+REFERENCE_PATTERN = re.compile(
+    b"|".join(
+        b"(?P<" + kind.encode() + b">" + pattern.pattern + b")"
+        for kind, pattern in zip(
+            REFERENCE_KINDS,
+            (PYTHON_VERSION_PATTERN, PACKAGE_VERSION_PATTERN, FILE_REFERENCE_PATTERN),
+            strict=True,
+        )
+    ),
+    re.MULTILINE,
+)
+
+NEWLINE_PATTERN = re.compile(rb"\n")
+
+# Applied to decoded file references: template placeholders to skip, and the
+# paths worth warning about when missing
+PLACEHOLDER_PATTERN = re.compile(r"your[_-]|[<>]")
+IMPORTANT_REFERENCE_PATTERN = re.compile(
+    r"custom_components|tests|docs|scripts|\.(?:py|json|md)"
+)
+
+# Generated files and directories, skipped when walking the repo so they
+# neither count as documentation nor as reference targets
+SKIP_DIRS = frozenset(
+    {
+        ".coverage",
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".venv",
+        "__pycache__",
+        "build",
+        "dist",
+        "htmlcov",
+        "node_modules",
+        "venv",
+    }
+)
+
+# Threads used to overlap manifest reads
+MANIFEST_WORKERS = 8
+
+# Report order for severities (most severe first)
+SEVERITY_RANK = {"error": 0, "warning": 1, "info": 2}
+
+SEVERITY_SYMBOLS = {"error": "❌", "warning": "⚠️ ", "info": "ℹ️ "}
+
+# Per-file results reused by --incremental; bump the version when checks change
+AUDIT_CACHE_FILE = ".audit_cache.json"
+AUDIT_CACHE_VERSION = 7
+
+
+def _line_starts(content: bytes) -> list[int]:
+    """Return the offset at which each line of content starts."""
+    return [0, *(match.end() for match in NEWLINE_PATTERN.finditer(content))]
+
+
+async def _read_files(paths: list[Path]) -> list[bytes]:
+    """Read files concurrently on worker threads, keeping the order of paths.
+
+    Keeps several reads in flight at once, which hides per-file latency on
+    network filesystems such as those on some CI runners.
+    """
+    async with asyncio.TaskGroup() as group:
+        tasks = [
+            group.create_task(asyncio.to_thread(path.read_bytes)) for path in paths
+        ]
+
+    return [task.result() for task in tasks]
+
+
+def _installed_versions() -> dict[str, str]:
+    """Return installed distribution versions keyed by lowercase name.
+
+    When a name is installed more than once on sys.path, the first wins, as
+    it does for import and pip show.
+    """
+    versions: dict[str, str] = {}
+    for dist in importlib.metadata.distributions():
+        if name := dist.metadata["Name"]:
+            versions.setdefault(name.lower(), dist.version)
+
+    return versions
+
+
+@lru_cache(maxsize=4096)
+def _syntax_error(code: bytes) -> str | None:
+    """Return the syntax error message for code, or None if it parses.
+
+    Memoized because templated docs repeat the same snippets across files.
+    """
+    try:
+        ast.parse(code)
+    except SyntaxError as e:
+        return str(e)
+
+    return None
 
 
 @dataclass
+class MarkdownFile:
+    """A markdown file read and scanned once, shared by all checks."""
+
+    rel_path: str
+    content: bytes
+    line_starts: list[int]
+    references: dict[str, list[re.Match[bytes]]]
+
+    @classmethod
+    def scan(cls, rel_path: str, content: bytes) -> MarkdownFile:
+        """Build the line table and collect references of every kind."""
+        references: dict[str, list[re.Match[bytes]]] = {
+            kind: [] for kind in REFERENCE_KINDS
+        }
+        for match in REFERENCE_PATTERN.finditer(content):
+            # The outer kind group always closes last, so it is lastgroup
+            if match.lastgroup is not None:
+                references[match.lastgroup].append(match)
+
+        return cls(rel_path, content, _line_starts(content), references)
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number containing offset."""
+        return bisect_right(self.line_starts, offset)
+
+
+@dataclass(slots=True, frozen=True)
 class AuditIssue:
     """Represents a documentation issue found during audit."""
 
@@ -38,15 +212,28 @@ class AuditIssue:
     line: int | None
     description: str
     suggestion: str | None = None
+    _rank: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        """Precompute the sort rank for the severity."""
+        object.__setattr__(self, "_rank", SEVERITY_RANK[self.severity])
 
-@dataclass
+
+@dataclass(slots=True)
 class AuditReport:
     """Contains the results of a documentation audit."""
 
     issues: list[AuditIssue] = field(default_factory=list)
     files_checked: int = 0
     checks_performed: int = 0
+    _seen: set[AuditIssue] = field(default_factory=set, repr=False)
+
+    def extend_issues(self, issues: Iterable[AuditIssue]) -> None:
+        """Add issues to the report, skipping any already reported."""
+        for issue in issues:
+            if issue not in self._seen:
+                self._seen.add(issue)
+                self.issues.append(issue)
 
     def add_issue(
         self,
@@ -58,80 +245,101 @@ class AuditReport:
         suggestion: str | None = None,
     ) -> None:
         """Add an issue to the report."""
-        self.issues.append(
-            AuditIssue(
-                severity=severity,
-                category=category,
-                file=file,
-                line=line,
-                description=description,
-                suggestion=suggestion,
+        self.extend_issues(
+            (
+                AuditIssue(
+                    severity=severity,
+                    category=category,
+                    file=file,
+                    line=line,
+                    description=description,
+                    suggestion=suggestion,
+                ),
             )
         )
 
     def print_report(self, verbose: bool = False) -> None:
-        """Print the audit report."""
-        print("\n" + "=" * 80)
-        print("DOCUMENTATION AUDIT REPORT")
-        print("=" * 80)
-        print(f"\nFiles Checked: {self.files_checked}")
-        print(f"Checks Performed: {self.checks_performed}")
-        print(f"Issues Found: {len(self.issues)}")
+        """Print the audit report.
+
+        The report is assembled in memory and written with a single call, so
+        large reports don't pay for thousands of separate writes.
+        """
+        parts: list[str] = []
+        add = parts.append
+
+        add("\n" + "=" * 80 + "\n")
+        add("DOCUMENTATION AUDIT REPORT\n")
+        add("=" * 80 + "\n")
+        add(f"\nFiles Checked: {self.files_checked}\n")
+        add(f"Checks Performed: {self.checks_performed}\n")
+        add(f"Issues Found: {len(self.issues)}\n")
 
         # Count by severity
-        errors = sum(1 for i in self.issues if i.severity == "error")
-        warnings = sum(1 for i in self.issues if i.severity == "warning")
-        info = sum(1 for i in self.issues if i.severity == "info")
+        counts = Counter(i.severity for i in self.issues)
 
-        print(f"  - Errors: {errors}")
-        print(f"  - Warnings: {warnings}")
-        print(f"  - Info: {info}")
+        add(f"  - Errors: {counts['error']}\n")
+        add(f"  - Warnings: {counts['warning']}\n")
+        add(f"  - Info: {counts['info']}\n")
 
         if self.issues:
-            print("\n" + "-" * 80)
-            print("ISSUES DETAILS")
-            print("-" * 80)
-
-            for issue in sorted(self.issues, key=lambda x: (x.severity, x.file)):
-                severity_symbol = {
-                    "error": "❌",
-                    "warning": "⚠️ ",
-                    "info": "ℹ️ ",
-                }[issue.severity]
-
-                print(
-                    f"\n{severity_symbol} [{issue.severity.upper()}] {issue.category}"
+            add("\n" + "-" * 80 + "\n")
+            add("ISSUES DETAILS\n")
+            add("-" * 80 + "\n")
+
+            for issue in sorted(self.issues, key=attrgetter("_rank", "file")):
+                line = f"   Line: {issue.line}\n" if issue.line else ""
+                fix = f"   Fix: {issue.suggestion}\n" if issue.suggestion else ""
+                add(
+                    f"\n{SEVERITY_SYMBOLS[issue.severity]} "
+                    f"[{issue.severity.upper()}] {issue.category}\n"
+                    f"   File: {issue.file}\n"
+                    f"{line}"
+                    f"   Issue: {issue.description}\n"
+                    f"{fix}"
                 )
-                print(f"   File: {issue.file}")
-                if issue.line:
-                    print(f"   Line: {issue.line}")
-                print(f"   Issue: {issue.description}")
-                if issue.suggestion:
-                    print(f"   Fix: {issue.suggestion}")
         else:
-            print("\n✅ No issues found! Documentation is in sync with code.")
+            add("\n✅ No issues found! Documentation is in sync with code.\n")
 
-        print("\n" + "=" * 80)
+        add("\n" + "=" * 80 + "\n")
+        sys.stdout.write("".join(parts))
 
 
 class DocumentationAuditor:
     """Performs comprehensive documentation audits."""
 
-    def __init__(self, repo_root: Path, verbose: bool = False):
+    def __init__(
+        self, repo_root: Path, verbose: bool = False, incremental: bool = False
+    ):
         """Initialize the auditor.
 
         Args:
             repo_root: Path to the repository root
             verbose: Enable verbose output
+            incremental: Reuse cached results for unchanged markdown files
         """
         self.repo_root = repo_root
         self.verbose = verbose
+        self.incremental = incremental
         self.report = AuditReport()
+        self._md_cache: dict[Path, MarkdownFile] = {}
+        self._md_stats: dict[str, tuple[int, int]] = {}
+        self._repo_paths: frozenset[str] = frozenset()
+        self._repo_links: frozenset[str] = frozenset()
+        self._audit_cache_files: dict[str, dict[str, Any]] = {}
+        self._audit_cache_key = ""
+        self._uncached_files: set[str] = set()
 
     def audit(self) -> AuditReport:
         """Run all audit checks."""
         print("🔍 Starting documentation audit...")
 
+        # Walk the repo once so each file reference is a set lookup, not a stat()
+        self._repo_paths, self._repo_links = self._collect_repo_paths()
+        if self.incremental:
+            # Shared by load and save; it scans every installed distribution
+            self._audit_cache_key = self._audit_cache_fingerprint()
+        self._load_markdown_files()
+
         self.check_python_version_references()
         self.check_package_version_references()
         self.check_file_directory_references()
@@ -139,52 +347,158 @@ class DocumentationAuditor:
         self.check_code_example_validity()
         self.check_skills_references()
 
+        if self.incremental:
+            self._save_audit_cache()
+
         return self.report
 
+    def _load_markdown_files(self) -> None:
+        """Read every markdown file once so the checks can share the content.
+
+        In incremental mode, files whose mtime and size match the audit cache
+        are not read; their cached issues are added to the report instead.
+        """
+        self._md_cache = {}
+        self._md_stats = {}
+        cached_files = self._load_audit_cache() if self.incremental else {}
+        files_checked = 0
+        to_read: dict[Path, str] = {}
+
+        for md_file in self._iter_files(lambda name: name.endswith(".md")):
+            files_checked += 1
+            rel_path = str(md_file.relative_to(self.repo_root))
+
+            if self.incremental:
+                stat = md_file.stat()
+                entry = cached_files.get(rel_path)
+                if isinstance(entry, dict):
+                    cached_issues = self._cached_issues(entry, stat)
+                    if cached_issues is not None:
+                        self.report.extend_issues(cached_issues)
+                        self._audit_cache_files[rel_path] = entry
+                        continue
+
+                self._md_stats[rel_path] = (stat.st_mtime_ns, stat.st_size)
+
+            to_read[md_file] = rel_path
+
+        contents = asyncio.run(_read_files(list(to_read)))
+        for (md_file, rel_path), content in zip(to_read.items(), contents, strict=True):
+            # read_bytes() skips universal newlines, and the patterns expect \n
+            content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            self._md_cache[md_file] = MarkdownFile.scan(rel_path, content)
+
+        self.report.files_checked = files_checked
+
+    def _audit_cache_fingerprint(self) -> str:
+        """Hash the inputs other than file content that cached issues depend on.
+
+        Covers the Python version, installed packages and exactly the repo path
+        set that file references resolve against, so a cache entry is dropped
+        when a referenced file appears or disappears even if the markdown file
+        itself is unchanged.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{AUDIT_CACHE_VERSION}\0{sys.version}\0".encode())
+        for name, version in sorted(_installed_versions().items()):
+            digest.update(f"{name}=={version}\0".encode())
+        for path in sorted(self._repo_paths):
+            digest.update(f"{path}\0".encode())
+        for path in sorted(self._repo_links):
+            digest.update(f"{path}\0>\0".encode())
+
+        return digest.hexdigest()
+
+    def _load_audit_cache(self) -> dict[str, Any]:
+        """Return the cached per-file results, or {} if stale or unreadable."""
+        try:
+            data = _json_loads((self.repo_root / AUDIT_CACHE_FILE).read_bytes())
+        except (OSError, ValueError):
+            # ValueError also covers UnicodeDecodeError from json.loads(bytes)
+            return {}
+
+        if (
+            not isinstance(data, dict)
+            or data.get("fingerprint") != self._audit_cache_key
+        ):
+            return {}
+
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    @staticmethod
+    def _cached_issues(
+        entry: dict[str, Any], stat: os.stat_result
+    ) -> list[AuditIssue] | None:
+        """Return the cached issues if entry matches stat, otherwise None.
+
+        A malformed entry is treated as a cache miss rather than an error.
+        """
+        try:
+            if entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                return None
+            return [AuditIssue(**issue) for issue in entry["issues"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _save_audit_cache(self) -> None:
+        """Persist per-file results for the markdown files scanned this run."""
+        for rel_path in self._uncached_files:
+            self._md_stats.pop(rel_path, None)
+
+        for rel_path, (mtime_ns, size) in self._md_stats.items():
+            self._audit_cache_files[rel_path] = {
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "issues": [],
+            }
+
+        for issue in self.report.issues:
+            if issue.file in self._md_stats:
+                self._audit_cache_files[issue.file]["issues"].append(
+                    {f.name: getattr(issue, f.name) for f in fields(issue) if f.init}
+                )
+
+        data = {
+            "fingerprint": self._audit_cache_key,
+            "files": self._audit_cache_files,
+        }
+        (self.repo_root / AUDIT_CACHE_FILE).write_text(
+            json.dumps(data), encoding="utf-8"
+        )
+
+    def _iter_files(self, matches: Callable[[str], bool]) -> Iterator[Path]:
+        """Yield files whose name matches, without descending into SKIP_DIRS."""
+        for dirpath, dirnames, filenames in os.walk(self.repo_root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for filename in filenames:
+                if matches(filename):
+                    yield Path(dirpath) / filename
+
     def check_python_version_references(self) -> None:
         """Check Python version references in documentation."""
         if self.verbose:
             print("  Checking Python version references...")
 
-        # Get actual Python version
-        try:
-            result = subprocess.run(
-                [sys.executable, "--version"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            actual_version = result.stdout.strip().replace("Python ", "")
-        except subprocess.CalledProcessError:
-            actual_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+        # The running interpreter is the one being audited
+        actual_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
 
         self.report.checks_performed += 1
 
-        # Find all Python version references in markdown files
-        version_pattern = re.compile(r"Python\s+(\d+\.\d+\.\d+)")
-
-        for md_file in self.repo_root.rglob("*.md"):
-            if ".git" in str(md_file):
-                continue
+        for markdown in self._md_cache.values():
+            for match in markdown.references["python_version"]:
+                doc_version = match.group("python").decode()
+                if doc_version != actual_version:
+                    self.report.add_issue(
+                        severity="error",
+                        category="version_mismatch",
+                        file=markdown.rel_path,
+                        line=markdown.line_of(match.start()),
+                        description=f"Python version mismatch: documented as {doc_version}, actual is {actual_version}",
+                        suggestion=f"Update to Python {actual_version}",
+                    )
 
-            self.report.files_checked += 1
-            content = md_file.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            for line_num, line in enumerate(lines, 1):
-                matches = version_pattern.findall(line)
-                for doc_version in matches:
-                    if doc_version != actual_version:
-                        self.report.add_issue(
-                            severity="error",
-                            category="version_mismatch",
-                            file=str(md_file.relative_to(self.repo_root)),
-                            line=line_num,
-                            description=f"Python version mismatch: documented as {doc_version}, actual is {actual_version}",
-                            suggestion=f"Update to Python {actual_version}",
-                        )
-
-    def check_package_version_references(self) -> None:  # noqa: C901
+    def check_package_version_references(self) -> None:
         """Check package version references against actual installed versions."""
         if self.verbose:
             print("  Checking package version references...")
@@ -196,114 +510,140 @@ class DocumentationAuditor:
 
         self.report.checks_performed += 1
 
-        # Pattern to find package version references like "homeassistant==2026.2.0"
-        version_pattern = re.compile(r"(homeassistant|pytest|ruff|mypy)==([\d.]+)")
+        # Look up installed versions once instead of spawning pip per match
+        installed = _installed_versions()
 
-        for md_file in self.repo_root.rglob("*.md"):
-            if ".git" in str(md_file):
-                continue
+        for markdown in self._md_cache.values():
+            for match in markdown.references["package_version"]:
+                package = match.group("package").decode()
+                version = match.group("pinned").decode()
+                actual_version = installed.get(package.lower())
+                if actual_version is None or actual_version == version:
+                    continue
+
+                self.report.add_issue(
+                    severity="warning",
+                    category="version_mismatch",
+                    file=markdown.rel_path,
+                    line=markdown.line_of(match.start()),
+                    description=f"{package} version mismatch: documented as {version}, installed is {actual_version}",
+                    suggestion=f"Update to {package}=={actual_version} or install correct version",
+                )
 
-            content = md_file.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            for line_num, line in enumerate(lines, 1):
-                matches = version_pattern.findall(line)
-                for package, version in matches:
-                    # Try to get actual version
-                    try:
-                        result = subprocess.run(
-                            [sys.executable, "-m", "pip", "show", package],
-                            capture_output=True,
-                            text=True,
-                            check=False,
-                        )
-                        if result.returncode == 0:
-                            for line_text in result.stdout.split("\n"):
-                                if line_text.startswith("Version:"):
-                                    actual_version = line_text.split(":", 1)[1].strip()
-                                    if actual_version != version:
-                                        self.report.add_issue(
-                                            severity="warning",
-                                            category="version_mismatch",
-                                            file=str(
-                                                md_file.relative_to(self.repo_root)
-                                            ),
-                                            line=line_num,
-                                            description=f"{package} version mismatch: documented as {version}, installed is {actual_version}",
-                                            suggestion=f"Update to {package}=={actual_version} or install correct version",
-                                        )
-                    except Exception:
-                        pass
-
-    def check_file_directory_references(self) -> None:  # noqa: C901
+    def check_file_directory_references(self) -> None:
         """Check that file and directory references in docs actually exist."""
         if self.verbose:
             print("  Checking file and directory references...")
 
         self.report.checks_performed += 1
 
-        # Patterns for file/directory references
-        patterns = [
-            re.compile(r"`([a-zA-Z0-9_/.-]+\.(py|json|md|yaml|yml|toml|txt))`"),
-            re.compile(
-                r"\[.*?\]\(([a-zA-Z0-9_/.-]+(?:\.(py|json|md|yaml|yml|toml|txt))?)\)"
-            ),
-            re.compile(r"^[\s-]*([a-zA-Z0-9_/.-]+/)$", re.MULTILINE),
-        ]
+        for markdown in self._md_cache.values():
+            self.report.extend_issues(self._scan_file_references(markdown))
+
+    def _collect_repo_paths(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Return the normalized repo-relative paths of files and of symlinks.
+
+        SKIP_DIRS and the audit cache are left out, and symlinks are returned
+        separately without being followed; references through any of them are
+        resolved by the Path.exists() fallback in _scan_file_references.
+        """
+        paths = {os.curdir}
+        links: set[str] = set()
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                entries = list(os.scandir(self.repo_root / rel_dir))
+            except OSError:
+                continue
+
+            for entry in entries:
+                if entry.name in SKIP_DIRS or (
+                    not rel_dir and entry.name == AUDIT_CACHE_FILE
+                ):
+                    continue
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_symlink():
+                    links.add(rel_path)
+                    continue
+                paths.add(rel_path)
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(rel_path)
 
-        for md_file in self.repo_root.rglob("*.md"):
-            if ".git" in str(md_file):
+        return frozenset(paths), frozenset(links)
+
+    def _outside_path_set(self, path: str) -> bool:
+        """Return whether a normalized path may exist without being in the set.
+
+        True for absolute paths, paths leaving the repo root, and paths through
+        a symlink, SKIP_DIRS or the audit cache.
+        """
+        if os.path.isabs(path) or path == os.pardir:
+            return True
+        parts = path.split(os.sep)
+        if parts[0] in (os.pardir, AUDIT_CACHE_FILE) or not SKIP_DIRS.isdisjoint(parts):
+            return True
+
+        return any(
+            os.sep.join(parts[:i]) in self._repo_links for i in range(1, len(parts) + 1)
+        )
+
+    def _scan_file_references(self, markdown: MarkdownFile) -> list[AuditIssue]:
+        """Return file reference issues for a single markdown file."""
+        issues: list[AuditIssue] = []
+        md_dir = os.path.dirname(markdown.rel_path)
+
+        for match in markdown.references["file_reference"]:
+            file_ref = (
+                match.group("backtick") or match.group("link") or match.group("dir")
+            ).decode()
+
+            # Skip URLs, anchors and home-directory paths
+            if file_ref.startswith(("http://", "https://", "#", "mailto:", "~")):
                 continue
 
-            content = md_file.read_text(encoding="utf-8")
-            lines = content.split("\n")
-
-            for line_num, line in enumerate(lines, 1):
-                for pattern in patterns:
-                    matches = pattern.findall(line)
-                    for match in matches:
-                        # Extract filename from tuple if needed
-                        file_ref = match[0] if isinstance(match, tuple) else match
-
-                        # Skip URLs and anchors
-                        if file_ref.startswith(("http://", "https://", "#", "mailto:")):
-                            continue
-
-                        # Skip placeholder patterns
-                        if any(p in file_ref for p in ["your_", "your-", "<", ">"]):
-                            continue
-
-                        # Try to resolve the path
-                        possible_paths = [
-                            self.repo_root / file_ref,
-                            self.repo_root / file_ref.lstrip("/"),
-                            md_file.parent / file_ref,
-                        ]
-
-                        exists = any(p.exists() for p in possible_paths)
-
-                        if not exists and not file_ref.startswith("~"):
-                            # Only warn for specific important directories/files
-                            if any(
-                                important in file_ref
-                                for important in [
-                                    "custom_components",
-                                    "tests",
-                                    "docs",
-                                    "scripts",
-                                    ".py",
-                                    ".json",
-                                    ".md",
-                                ]
-                            ):
-                                self.report.add_issue(
-                                    severity="warning",
-                                    category="file_reference",
-                                    file=str(md_file.relative_to(self.repo_root)),
-                                    line=line_num,
-                                    description=f"Referenced file/directory may not exist: {file_ref}",
-                                    suggestion="Verify the path exists or update the reference",
-                                )
+            # Skip placeholder patterns
+            if PLACEHOLDER_PATTERN.search(file_ref):
+                continue
+
+            # Try to resolve the path from the repo root or the doc's dir
+            candidates = (
+                file_ref,
+                file_ref.lstrip("/"),
+                os.path.join(md_dir, file_ref),
+            )
+            normalized = [os.path.normpath(path) for path in candidates]
+            if not self._repo_paths.isdisjoint(normalized):
+                continue
+
+            # Only warn for specific important directories/files
+            if not IMPORTANT_REFERENCE_PATTERN.search(file_ref):
+                continue
+
+            # Probe the filesystem for paths the set can't see. The fingerprint
+            # can't see them either, so keep this file out of the audit cache
+            unseen = [
+                path
+                for path, norm in zip(candidates, normalized, strict=True)
+                if self._outside_path_set(norm)
+            ]
+            if unseen:
+                self._uncached_files.add(markdown.rel_path)
+                if any((self.repo_root / path).exists() for path in unseen):
+                    continue
+
+            issues.append(
+                AuditIssue(
+                    severity="warning",
+                    category="file_reference",
+                    file=markdown.rel_path,
+                    line=markdown.line_of(match.start()),
+                    description=f"Referenced file/directory may not exist: {file_ref}",
+                    suggestion="Verify the path exists or update the reference",
+                )
+            )
+
+        return issues
 
     def check_manifest_consistency(self) -> None:
         """Check manifest.json consistency with documentation."""
@@ -312,49 +652,63 @@ class DocumentationAuditor:
 
         self.report.checks_performed += 1
 
-        # Find all manifest.json files
-        for manifest_path in self.repo_root.rglob("manifest.json"):
-            if ".git" in str(manifest_path):
-                continue
-
-            try:
-                with open(manifest_path, encoding="utf-8") as f:
-                    manifest = json.load(f)
+        # Manifests are independent, so overlap their reads across threads
+        manifest_paths = list(self._iter_files(lambda name: name == "manifest.json"))
+        with ThreadPoolExecutor(max_workers=MANIFEST_WORKERS) as executor:
+            for issues in executor.map(self._check_one_manifest, manifest_paths):
+                self.report.extend_issues(issues)
 
-                # Check if domain matches directory name
-                domain = manifest.get("domain")
-                if domain and manifest_path.parent.name != domain:
-                    self.report.add_issue(
-                        severity="error",
-                        category="manifest_mismatch",
-                        file=str(manifest_path.relative_to(self.repo_root)),
-                        line=None,
-                        description=f"Domain '{domain}' doesn't match directory name '{manifest_path.parent.name}'",
-                        suggestion="Ensure domain and directory name match",
-                    )
+    def _check_one_manifest(self, manifest_path: Path) -> list[AuditIssue]:
+        """Return consistency issues for a single manifest.json."""
+        issues: list[AuditIssue] = []
+        rel_path = str(manifest_path.relative_to(self.repo_root))
 
-                # Check for required fields
-                required_fields = ["domain", "name", "version", "codeowners"]
-                for field in required_fields:
-                    if field not in manifest:
-                        self.report.add_issue(
-                            severity="error",
-                            category="manifest_incomplete",
-                            file=str(manifest_path.relative_to(self.repo_root)),
-                            line=None,
-                            description=f"Missing required field: {field}",
-                            suggestion=f"Add '{field}' to manifest.json",
-                        )
-
-            except json.JSONDecodeError as e:
-                self.report.add_issue(
+        try:
+            manifest = _json_loads(manifest_path.read_bytes())
+        except ValueError as e:
+            # ValueError also covers UnicodeDecodeError from json.loads(bytes)
+            issues.append(
+                AuditIssue(
                     severity="error",
                     category="manifest_invalid",
-                    file=str(manifest_path.relative_to(self.repo_root)),
+                    file=rel_path,
                     line=None,
                     description=f"Invalid JSON: {e}",
                     suggestion="Fix JSON syntax errors",
                 )
+            )
+            return issues
+
+        # Check if domain matches directory name
+        domain = manifest.get("domain")
+        if domain and manifest_path.parent.name != domain:
+            issues.append(
+                AuditIssue(
+                    severity="error",
+                    category="manifest_mismatch",
+                    file=rel_path,
+                    line=None,
+                    description=f"Domain '{domain}' doesn't match directory name '{manifest_path.parent.name}'",
+                    suggestion="Ensure domain and directory name match",
+                )
+            )
+
+        # Check for required fields
+        required_fields = ["domain", "name", "version", "codeowners"]
+        for field_name in required_fields:
+            if field_name not in manifest:
+                issues.append(
+                    AuditIssue(
+                        severity="error",
+                        category="manifest_incomplete",
+                        file=rel_path,
+                        line=None,
+                        description=f"Missing required field: {field_name}",
+                        suggestion=f"Add '{field_name}' to manifest.json",
+                    )
+                )
+
+        return issues
 
     def check_code_example_validity(self) -> None:
         """Check that code examples in docs are syntactically valid."""
@@ -363,33 +717,22 @@ class DocumentationAuditor:
 
         self.report.checks_performed += 1
 
-        # Pattern to find Python code blocks
-        code_block_pattern = re.compile(r"```python\n(.*?)```", re.DOTALL)
+        for markdown in self._md_cache.values():
+            for match in CODE_BLOCK_PATTERN.finditer(markdown.content):
+                code_block = match.group(1)
 
-        for md_file in self.repo_root.rglob("*.md"):
-            if ".git" in str(md_file):
-                continue
-
-            content = md_file.read_text(encoding="utf-8")
-            code_blocks = code_block_pattern.findall(content)
-
-            for code_block in code_blocks:
                 # Skip examples with placeholders
-                if any(
-                    p in code_block for p in ["...", "your_", "my_", "<", ">", "# "]
-                ):
+                if any(p in code_block for p in [b"...", b"your_", b"my_", b"<", b">"]):
                     continue
 
-                # Try to parse the code
-                try:
-                    ast.parse(code_block)
-                except SyntaxError as e:
+                error = _syntax_error(code_block)
+                if error is not None:
                     self.report.add_issue(
                         severity="warning",
                         category="code_example",
-                        file=str(md_file.relative_to(self.repo_root)),
-                        line=None,
-                        description=f"Code example has syntax error: {e}",
+                        file=markdown.rel_path,
+                        line=markdown.line_of(match.start()),
+                        description=f"Code example has syntax error: {error}",
                         suggestion="Fix the Python syntax in the code example",
                     )
 
@@ -419,26 +762,45 @@ class DocumentationAuditor:
             if d.is_dir() and not d.name.startswith(".")
         ]
 
+        if not actual_skills:
+            return
+
+        # One pass per file finds every mentioned skill. Longest names go
+        # first so a shorter name that prefixes a longer one can't shadow it.
+        skill_pattern = re.compile(
+            rb"\b("
+            + b"|".join(
+                re.escape(skill.encode())
+                for skill in sorted(actual_skills, key=len, reverse=True)
+            )
+            + rb")\b"
+        )
+
         # Check documentation for skill references
-        for md_file in self.repo_root.rglob("*.md"):
-            if ".git" in str(md_file):
+        for markdown in self._md_cache.values():
+            content = markdown.content
+
+            # Only installation instructions for the skills are checked
+            if b"ha-skills" not in content or (
+                b"resources/skills" not in content
+                and b"~/.claude/skills" not in content
+            ):
                 continue
 
-            content = md_file.read_text(encoding="utf-8")
-
-            # Check for skills installation instructions
-            if "resources/skills" in content or "~/.claude/skills" in content:
-                # Verify the instructions mention the correct skills
-                for skill in actual_skills:
-                    if skill not in content and "ha-skills" in content:
-                        self.report.add_issue(
-                            severity="info",
-                            category="skills_documentation",
-                            file=str(md_file.relative_to(self.repo_root)),
-                            line=None,
-                            description=f"Skills directory contains '{skill}' but documentation may not reference it correctly",
-                            suggestion="Verify skills installation instructions are accurate",
-                        )
+            # Verify the instructions mention the correct skills
+            mentioned = {
+                match.group(1).decode() for match in skill_pattern.finditer(content)
+            }
+            for skill in actual_skills:
+                if skill not in mentioned:
+                    self.report.add_issue(
+                        severity="info",
+                        category="skills_documentation",
+                        file=markdown.rel_path,
+                        line=None,
+                        description=f"Skills directory contains '{skill}' but documentation may not reference it correctly",
+                        suggestion="Verify skills installation instructions are accurate",
+                    )
 
 
 def main() -> int:
@@ -454,6 +816,11 @@ def main() -> int:
         action="store_true",
         help="Attempt to auto-fix issues (not implemented yet)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=f"Skip markdown files unchanged since the last run (cached in {AUDIT_CACHE_FILE})",
+    )
 
     args = parser.parse_args()
 
@@ -461,7 +828,9 @@ def main() -> int:
     repo_root = Path(__file__).parent.parent.resolve()
 
     # Run audit
-    auditor = DocumentationAuditor(repo_root, verbose=args.verbose)
+    auditor = DocumentationAuditor(
+        repo_root, verbose=args.verbose, incremental=args.incremental
+    )
     report = auditor.audit()
 
     # Print report
@@ -83,22 +83,32 @@ def check_package_installed(package_name: str, import_name: str | None = None) -
     return False
 
 
-def check_command_available(command: str) -> bool:
-    """Check if a command-line tool is available."""
+def start_version_probe(command: str) -> subprocess.Popen[str] | None:
+    """Start `command --version` in the background, or None if not found."""
     try:
-        result = subprocess.run(
+        return subprocess.Popen(
             [command, "--version"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False,
-            timeout=5,
         )
-        if result.returncode == 0:
-            version = result.stdout.strip().split("\n")[0]
-            print_success(f"{command} available ({version})")
-            return True
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    except FileNotFoundError:
+        return None
+
+
+def check_command_available(command: str, probe: subprocess.Popen[str] | None) -> bool:
+    """Check if a command-line tool is available, given its start_version_probe()."""
+    if probe is not None:
+        try:
+            stdout, _ = probe.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            probe.kill()
+            probe.communicate()
+        else:
+            if probe.returncode == 0:
+                version = stdout.strip().split("\n")[0]
+                print_success(f"{command} available ({version})")
+                return True
 
     print_error(f"{command} - not available")
     return False
@@ -132,6 +142,12 @@ def main() -> int:
     results: dict[str, bool] = {}
     is_ci = os.environ.get("CI") == "true"
 
+    # Start the tool probes first so they run while the other checks do
+    probes = {
+        command: start_version_probe(command)
+        for command in ("ruff", "mypy", "pre-commit")
+    }
+
     # Python Environment
     print_header("Python Environment")
     results["python_version"] = check_python_version()
@@ -166,9 +182,8 @@ def main() -> int:
 
     # Code Quality Tools
     print_header("Code Quality Tools")
-    results["ruff"] = check_command_available("ruff")
-    results["mypy"] = check_command_available("mypy")
-    results["pre-commit"] = check_command_available("pre-commit")
+    for command, probe in probes.items():
+        results[command] = check_command_available(command, probe)
 
     # Project Structure
     print_header("Project Structure")